@@ -0,0 +1,28 @@
+"""drop mission created_at brin index
+
+Revision ID: 0c7d3e5b9a12
+Revises: f5c1e7a9d324
+Create Date: 2026-10-15 17:04:51.208337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c7d3e5b9a12'
+down_revision: Union[str, None] = 'f5c1e7a9d324'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_missions_created_at_brin', table_name='missions', postgresql_using='brin', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_missions_created_at_brin', 'missions', ['created_at'], unique=False, postgresql_using='brin', postgresql_concurrently=True)
@@ -0,0 +1,28 @@
+"""user auth indexes
+
+Revision ID: 4f1c9a7e2b3d
+Revises: 99820e7ed332
+Create Date: 2026-10-15 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c9a7e2b3d'
+down_revision: Union[str, None] = '99820e7ed332'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_id_auth', 'users', ['id'], unique=False, postgresql_include=['is_active', 'role'])
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
+    op.drop_index('ix_users_id_auth', table_name='users')
@@ -0,0 +1,31 @@
+"""server side uuid defaults
+
+Revision ID: 5a0d7e93b6f1
+Revises: e91a4b7c2d05
+Create Date: 2026-10-15 13:36:14.902583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a0d7e93b6f1'
+down_revision: Union[str, None] = 'e91a4b7c2d05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it before that
+    if op.get_bind().dialect.server_version_info < (13,):
+        op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in ('users', 'robots', 'missions'):
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in ('missions', 'robots', 'users'):
+        op.alter_column(table, 'id', server_default=None)
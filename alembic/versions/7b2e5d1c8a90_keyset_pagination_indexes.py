@@ -0,0 +1,28 @@
+"""keyset pagination indexes
+
+Revision ID: 7b2e5d1c8a90
+Revises: 4f1c9a7e2b3d
+Create Date: 2026-10-15 11:04:52.718230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e5d1c8a90'
+down_revision: Union[str, None] = '4f1c9a7e2b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_missions_created_id', 'missions', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_robots_created_id', 'robots', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_robots_created_id', table_name='robots')
+    op.drop_index('ix_missions_created_id', table_name='missions')
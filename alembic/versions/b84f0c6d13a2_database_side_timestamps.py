@@ -0,0 +1,48 @@
+"""database side timestamps
+
+Revision ID: b84f0c6d13a2
+Revises: 5a0d7e93b6f1
+Create Date: 2026-10-15 14:02:45.336718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b84f0c6d13a2'
+down_revision: Union[str, None] = '5a0d7e93b6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'robots', 'missions')
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = statement_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(SET_UPDATED_AT_FUNCTION)
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.text('statement_timestamp()'))
+        op.alter_column(table, 'updated_at', server_default=sa.text('statement_timestamp()'))
+        op.execute(
+            f'CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} '
+            'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f'DROP TRIGGER {table}_set_updated_at ON {table}')
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
+    op.execute('DROP FUNCTION set_updated_at()')
@@ -0,0 +1,38 @@
+"""enum labels from values
+
+Revision ID: c3d8f2a61e47
+Revises: 7b2e5d1c8a90
+Create Date: 2026-10-15 12:21:07.553904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8f2a61e47'
+down_revision: Union[str, None] = '7b2e5d1c8a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ENUM_LABELS = {
+    'robottype': ['AMR', 'AGV', 'DRONE', 'ARM', 'HUMANOID'],
+    'robotstatus': ['IDLE', 'ACTIVE', 'CHARGING', 'MAINTENANCE', 'OFFLINE', 'ERROR'],
+    'userrole': ['VIEWER', 'OPERATOR', 'ADMIN'],
+    'missionstatus': ['PENDING', 'ASSIGNED', 'IN_PROGRESS', 'COMPLETED', 'FAILED', 'CANCELLED'],
+    'missionpriority': ['LOW', 'NORMAL', 'HIGH', 'CRITICAL'],
+}
+
+
+def upgrade() -> None:
+    for type_name, labels in ENUM_LABELS.items():
+        for label in labels:
+            op.execute(f"ALTER TYPE {type_name} RENAME VALUE '{label}' TO '{label.lower()}'")
+
+
+def downgrade() -> None:
+    for type_name, labels in ENUM_LABELS.items():
+        for label in labels:
+            op.execute(f"ALTER TYPE {type_name} RENAME VALUE '{label.lower()}' TO '{label}'")
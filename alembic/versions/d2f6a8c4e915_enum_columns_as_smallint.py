@@ -0,0 +1,53 @@
+"""enum columns as smallint
+
+Revision ID: d2f6a8c4e915
+Revises: b84f0c6d13a2
+Create Date: 2026-10-15 14:51:20.117482
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6a8c4e915'
+down_revision: Union[str, None] = 'b84f0c6d13a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type, labels in definition order). A label's
+# SMALLINT code is its index in this list.
+ENUM_COLUMNS = [
+    ('robots', 'robot_type', 'robottype', ['amr', 'agv', 'drone', 'arm', 'humanoid']),
+    ('robots', 'status', 'robotstatus', ['idle', 'active', 'charging', 'maintenance', 'offline', 'error']),
+    ('users', 'role', 'userrole', ['viewer', 'operator', 'admin']),
+    ('missions', 'status', 'missionstatus', ['pending', 'assigned', 'in_progress', 'completed', 'failed', 'cancelled']),
+    ('missions', 'priority', 'missionpriority', ['low', 'normal', 'high', 'critical']),
+]
+
+
+def upgrade() -> None:
+    # The partial index predicate compares against enum labels
+    op.drop_index('ix_missions_schedulable_scheduled_at', table_name='missions')
+    for table, column, type_name, _ in ENUM_COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint '
+            f'USING array_position(enum_range(NULL::{type_name}), {column}) - 1'
+        )
+        op.execute(f'DROP TYPE {type_name}')
+    op.create_index('ix_missions_schedulable_scheduled_at', 'missions', ['scheduled_at'], unique=False, postgresql_where=sa.text('status IN (0, 1)'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_missions_schedulable_scheduled_at', table_name='missions')
+    for table, column, type_name, labels in ENUM_COLUMNS:
+        quoted = ', '.join(f"'{label}'" for label in labels)
+        op.execute(f'CREATE TYPE {type_name} AS ENUM ({quoted})')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} '
+            f'USING (enum_range(NULL::{type_name}))[{column} + 1]'
+        )
+    op.create_index('ix_missions_schedulable_scheduled_at', 'missions', ['scheduled_at'], unique=False, postgresql_where=sa.text("status IN ('pending', 'assigned')"))
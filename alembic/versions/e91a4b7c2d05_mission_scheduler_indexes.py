@@ -0,0 +1,31 @@
+"""mission scheduler indexes
+
+Revision ID: e91a4b7c2d05
+Revises: c3d8f2a61e47
+Create Date: 2026-10-15 12:48:39.180246
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91a4b7c2d05'
+down_revision: Union[str, None] = 'c3d8f2a61e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_missions_status'), 'missions', ['status'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_missions_schedulable_scheduled_at', 'missions', ['scheduled_at'], unique=False, postgresql_where=sa.text("status IN ('pending', 'assigned')"), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_missions_schedulable_scheduled_at', table_name='missions', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_missions_status'), table_name='missions', postgresql_concurrently=True)
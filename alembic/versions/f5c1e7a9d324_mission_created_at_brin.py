@@ -0,0 +1,28 @@
+"""mission created_at brin index
+
+Revision ID: f5c1e7a9d324
+Revises: d2f6a8c4e915
+Create Date: 2026-10-15 15:22:07.531946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c1e7a9d324'
+down_revision: Union[str, None] = 'd2f6a8c4e915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_missions_created_at_brin', 'missions', ['created_at'], unique=False, postgresql_using='brin', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_missions_created_at_brin', table_name='missions', postgresql_using='brin', postgresql_concurrently=True)
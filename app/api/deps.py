@@ -1,10 +1,12 @@
-from typing import Annotated
+from typing import Annotated, NamedTuple
+from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import ResponseCache, get_response_cache
 from app.core.security import decode_token
 from app.db.session import get_session
 from app.models.user import User, UserRole
@@ -12,10 +14,19 @@ from app.models.user import User, UserRole
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+class AuthedUser(NamedTuple):
+    """The columns of the authenticated user that route dependencies need."""
+
+    id: UUID
+    is_active: bool
+    role: UserRole
+
+
 async def get_current_user(
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     token: Annotated[str, Depends(oauth2_scheme)],
-) -> User:
+) -> AuthedUser:
     """Get the current authenticated user."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -23,7 +34,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_token(token)
+    # AuthMiddleware has usually decoded the token already
+    if hasattr(request.state, "jwt"):
+        payload = request.state.jwt
+    else:
+        payload = decode_token(token)
     if payload is None:
         raise credentials_exception
 
@@ -31,11 +46,15 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Covered by ix_users_id_auth, so Postgres can answer from the index
+    result = await session.execute(
+        select(User.id, User.is_active, User.role).where(User.id == user_id)
+    )
+    row = result.one_or_none()
 
-    if user is None:
+    if row is None:
         raise credentials_exception
+    user = AuthedUser(*row)
 
     if not user.is_active:
         raise HTTPException(
@@ -47,8 +66,8 @@ async def get_current_user(
 
 
 async def require_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthedUser, Depends(get_current_user)],
+) -> AuthedUser:
     """Require admin role."""
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
@@ -59,8 +78,8 @@ async def require_admin(
 
 
 async def require_operator(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthedUser, Depends(get_current_user)],
+) -> AuthedUser:
     """Require operator or admin role."""
     if current_user.role not in (UserRole.OPERATOR, UserRole.ADMIN):
         raise HTTPException(
@@ -70,8 +89,10 @@ async def require_operator(
     return current_user
 
 
-# Type aliases for cleaner route signatures
-CurrentUser = Annotated[User, Depends(get_current_user)]
-AdminUser = Annotated[User, Depends(require_admin)]
-OperatorUser = Annotated[User, Depends(require_operator)]
+# Type aliases for cleaner route signatures. Every alias shares the same
+# get_current_user dependency, so FastAPI resolves it once per request.
+CurrentUser = Annotated[AuthedUser, Depends(get_current_user)]
+AdminUser = Annotated[AuthedUser, Depends(require_admin)]
+OperatorUser = Annotated[AuthedUser, Depends(require_operator)]
 DBSession = Annotated[AsyncSession, Depends(get_session)]
+Cache = Annotated[ResponseCache, Depends(get_response_cache)]
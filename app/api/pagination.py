@@ -0,0 +1,49 @@
+import base64
+import binascii
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encode a row's sort key as an opaque page cursor."""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a page cursor back into its (created_at, id) sort key."""
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def keyset_page(
+    query: Select[Any], model: Any, cursor: str | None, limit: int
+) -> Select[Any]:
+    """Order newest first and fetch one row past the page after ``cursor``.
+
+    The extra row tells the caller whether there is a next page.
+    """
+    if cursor:
+        query = query.where(
+            tuple_(model.created_at, model.id) < decode_cursor(cursor)
+        )
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> str | None:
+    """Cursor for the page after ``rows``, or None if this is the last one."""
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(last.created_at, last.id)
@@ -2,10 +2,16 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
 
 from app.api.deps import DBSession
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import (
+    create_access_token,
+    hash_password,
+    password_needs_rehash,
+    verify_password_or_dummy,
+)
 from app.models.user import User
 from app.schemas.user import Token, UserCreate, UserRead
 
@@ -18,24 +24,24 @@ async def register(
     session: DBSession,
 ) -> User:
     """Register a new user."""
-    # Check if user exists
-    result = await session.execute(select(User).where(User.email == user_in.email))
-    if result.scalar_one_or_none():
+    hashed_password = await hash_password(user_in.password)
+    try:
+        result = await session.execute(
+            insert(User)
+            .values(
+                email=user_in.email,
+                hashed_password=hashed_password,
+                full_name=user_in.full_name,
+            )
+            .returning(User)
+        )
+    except IntegrityError:
+        # ix_users_email_lower rejects the email case-insensitively
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
-
-    # Create user
-    user = User(
-        email=user_in.email,
-        hashed_password=hash_password(user_in.password),
-        full_name=user_in.full_name,
-    )
-    session.add(user)
-    await session.flush()
-    await session.refresh(user)
-    return user
+    return result.scalar_one()
 
 
 @router.post("/login", response_model=Token)
@@ -44,10 +50,17 @@ async def login(
     session: DBSession,
 ) -> Token:
     """Login and get access token."""
-    result = await session.execute(select(User).where(User.email == form_data.username))
+    result = await session.execute(
+        select(User).where(func.lower(User.email) == form_data.username.lower())
+    )
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Always run a hash verification so response time doesn't reveal
+    # whether the email is registered
+    verified = await verify_password_or_dummy(
+        form_data.password, user.hashed_password if user else None
+    )
+    if not user or not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -60,5 +73,9 @@ async def login(
             detail="Inactive user",
         )
 
+    # Transparently upgrade legacy bcrypt hashes on successful login
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password(form_data.password)
+
     access_token = create_access_token(subject=str(user.id))
     return Token(access_token=access_token)
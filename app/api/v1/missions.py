@@ -1,36 +1,58 @@
-from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import delete, exists, func, insert, select, update
 
-from app.api.deps import CurrentUser, DBSession, OperatorUser
-from app.models.mission import Mission, MissionStatus
+from app.api.deps import Cache, CurrentUser, DBSession, OperatorUser
+from app.api.pagination import keyset_page, next_cursor
+from app.core.clock import now_utc
+from app.models.mission import SCHEDULABLE_STATUSES, Mission, MissionStatus
 from app.models.robot import Robot
 from app.schemas.mission import MissionAssign, MissionCreate, MissionRead, MissionUpdate
+from app.schemas.pagination import Page
 
 router = APIRouter(prefix="/missions", tags=["missions"])
 
+_mission_page = TypeAdapter(Page[MissionRead])
 
-@router.get("", response_model=list[MissionRead])
+
+@router.get("", response_model=Page[MissionRead])
 async def list_missions(
     session: DBSession,
     current_user: CurrentUser,
-    skip: int = 0,
-    limit: int = 100,
+    cache: Cache,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
     status_filter: MissionStatus | None = Query(None, alias="status"),
     robot_id: UUID | None = None,
-) -> list[Mission]:
+) -> Response:
     """List all missions with optional filtering."""
-    query = select(Mission)
-
-    if status_filter:
-        query = query.where(Mission.status == status_filter)
-    if robot_id:
-        query = query.where(Mission.robot_id == robot_id)
-
-    result = await session.execute(query.offset(skip).limit(limit))
-    return list(result.scalars().all())
+    key = cache.key(
+        "missions",
+        cursor=cursor,
+        limit=limit,
+        status_filter=status_filter,
+        robot_id=robot_id,
+    )
+    payload = await cache.get(key)
+    if payload is None:
+        query = select(Mission)
+
+        if status_filter:
+            query = query.where(Mission.status == status_filter)
+        if robot_id:
+            query = query.where(Mission.robot_id == robot_id)
+
+        result = await session.execute(keyset_page(query, Mission, cursor, limit))
+        missions = result.scalars().all()
+        page = _mission_page.validate_python(
+            {"items": missions[:limit], "next_cursor": next_cursor(missions, limit)},
+            from_attributes=True,
+        )
+        payload = _mission_page.dump_json(page)
+        await cache.set("missions", key, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("", response_model=MissionRead, status_code=status.HTTP_201_CREATED)
@@ -38,12 +60,16 @@ async def create_mission(
     mission_in: MissionCreate,
     session: DBSession,
     current_user: OperatorUser,
+    cache: Cache,
 ) -> Mission:
     """Create a new mission."""
-    mission = Mission(**mission_in.model_dump())
-    session.add(mission)
-    await session.flush()
-    await session.refresh(mission)
+    result = await session.execute(
+        insert(Mission).values(**mission_in.model_dump()).returning(Mission)
+    )
+    mission = result.scalar_one()
+    # Commit before invalidating, or a concurrent read could re-cache old rows
+    await session.commit()
+    await cache.invalidate("missions")
     return mission
 
 
@@ -70,31 +96,41 @@ async def update_mission(
     mission_in: MissionUpdate,
     session: DBSession,
     current_user: OperatorUser,
+    cache: Cache,
 ) -> Mission:
     """Update mission details."""
-    result = await session.execute(select(Mission).where(Mission.id == mission_id))
-    mission = result.scalar_one_or_none()
-    if not mission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Mission not found",
-        )
-
     update_data = mission_in.model_dump(exclude_unset=True)
 
     # Handle status transitions
     if "status" in update_data:
         new_status = update_data["status"]
-        if new_status == MissionStatus.IN_PROGRESS and not mission.started_at:
-            mission.started_at = datetime.now(timezone.utc)
+        if new_status == MissionStatus.IN_PROGRESS:
+            # Keep the original start time if the mission was already started
+            update_data["started_at"] = func.coalesce(Mission.started_at, now_utc())
         elif new_status in (MissionStatus.COMPLETED, MissionStatus.FAILED):
-            mission.completed_at = datetime.now(timezone.utc)
-
-    for field, value in update_data.items():
-        setattr(mission, field, value)
-
-    await session.flush()
-    await session.refresh(mission)
+            update_data["completed_at"] = now_utc()
+
+    if update_data:
+        result = await session.execute(
+            update(Mission)
+            .where(Mission.id == mission_id)
+            .values(**update_data)
+            .returning(Mission)
+            .execution_options(populate_existing=True)
+        )
+    else:
+        # Nothing to change, and an UPDATE with an empty SET is invalid SQL
+        result = await session.execute(
+            select(Mission).where(Mission.id == mission_id)
+        )
+    mission = result.scalar_one_or_none()
+    if not mission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Mission not found",
+        )
+    await session.commit()
+    await cache.invalidate("missions")
     return mission
 
 
@@ -104,38 +140,47 @@ async def assign_mission(
     assign_in: MissionAssign,
     session: DBSession,
     current_user: OperatorUser,
+    cache: Cache,
 ) -> Mission:
     """Assign a robot to a mission."""
-    # Get mission
-    result = await session.execute(select(Mission).where(Mission.id == mission_id))
-    mission = result.scalar_one_or_none()
-    if not mission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Mission not found",
+    # Status guard and robot check run inside the UPDATE, so the happy path
+    # is a single atomic round trip
+    result = await session.execute(
+        update(Mission)
+        .where(
+            Mission.id == mission_id,
+            Mission.status.in_(SCHEDULABLE_STATUSES),
+            exists().where(Robot.id == assign_in.robot_id),
         )
+        .values(robot_id=assign_in.robot_id, status=MissionStatus.ASSIGNED)
+        .returning(Mission)
+        .execution_options(populate_existing=True)
+    )
+    mission = result.scalar_one_or_none()
 
-    # Verify mission can be assigned
-    if mission.status not in (MissionStatus.PENDING, MissionStatus.ASSIGNED):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot assign mission with status {mission.status.value}",
+    if not mission:
+        # Nothing updated: work out why
+        status_result = await session.execute(
+            select(Mission.status).where(Mission.id == mission_id)
         )
-
-    # Verify robot exists
-    result = await session.execute(select(Robot).where(Robot.id == assign_in.robot_id))
-    robot = result.scalar_one_or_none()
-    if not robot:
+        mission_status = status_result.scalar_one_or_none()
+        if mission_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Mission not found",
+            )
+        if mission_status not in SCHEDULABLE_STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot assign mission with status {mission_status.value}",
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Robot not found",
         )
 
-    mission.robot_id = assign_in.robot_id
-    mission.status = MissionStatus.ASSIGNED
-
-    await session.flush()
-    await session.refresh(mission)
+    await session.commit()
+    await cache.invalidate("missions")
     return mission
 
 
@@ -144,13 +189,16 @@ async def delete_mission(
     mission_id: UUID,
     session: DBSession,
     current_user: OperatorUser,
+    cache: Cache,
 ) -> None:
     """Delete a mission."""
-    result = await session.execute(select(Mission).where(Mission.id == mission_id))
-    mission = result.scalar_one_or_none()
-    if not mission:
+    result = await session.execute(
+        delete(Mission).where(Mission.id == mission_id).returning(Mission.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Mission not found",
         )
-    await session.delete(mission)
+    await session.commit()
+    await cache.invalidate("missions")
@@ -1,26 +1,47 @@
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
-from sqlalchemy import select
-
-from app.api.deps import CurrentUser, DBSession, OperatorUser
-from app.core.websocket import manager
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.api.deps import Cache, CurrentUser, DBSession, OperatorUser
+from app.api.pagination import keyset_page, next_cursor
+from app.core.broadcaster import broadcaster
+from app.core.status_batcher import status_batcher
 from app.models.robot import Robot
+from app.schemas.pagination import Page
 from app.schemas.robot import RobotCreate, RobotRead, RobotStatusUpdate, RobotUpdate
+from app.schemas.ws import encode_status_update
 
 router = APIRouter(prefix="/robots", tags=["robots"])
 
+_robot_page = TypeAdapter(Page[RobotRead])
+
 
-@router.get("", response_model=list[RobotRead])
+@router.get("", response_model=Page[RobotRead])
 async def list_robots(
     session: DBSession,
     current_user: CurrentUser,
-    skip: int = 0,
-    limit: int = 100,
-) -> list[Robot]:
+    cache: Cache,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+) -> Response:
     """List all robots in the fleet."""
-    result = await session.execute(select(Robot).offset(skip).limit(limit))
-    return list(result.scalars().all())
+    key = cache.key("robots", cursor=cursor, limit=limit)
+    payload = await cache.get(key)
+    if payload is None:
+        result = await session.execute(
+            keyset_page(select(Robot), Robot, cursor, limit)
+        )
+        robots = result.scalars().all()
+        page = _robot_page.validate_python(
+            {"items": robots[:limit], "next_cursor": next_cursor(robots, limit)},
+            from_attributes=True,
+        )
+        payload = _robot_page.dump_json(page)
+        await cache.set("robots", key, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("", response_model=RobotRead, status_code=status.HTTP_201_CREATED)
@@ -28,22 +49,23 @@ async def create_robot(
     robot_in: RobotCreate,
     session: DBSession,
     current_user: OperatorUser,
+    cache: Cache,
 ) -> Robot:
     """Register a new robot."""
-    # Check serial number uniqueness
-    result = await session.execute(
-        select(Robot).where(Robot.serial_number == robot_in.serial_number)
-    )
-    if result.scalar_one_or_none():
+    try:
+        result = await session.execute(
+            insert(Robot).values(**robot_in.model_dump()).returning(Robot)
+        )
+    except IntegrityError:
+        # Serial numbers are unique
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Serial number already registered",
         )
-
-    robot = Robot(**robot_in.model_dump())
-    session.add(robot)
-    await session.flush()
-    await session.refresh(robot)
+    robot = result.scalar_one()
+    # Commit before invalidating, or a concurrent read could re-cache old rows
+    await session.commit()
+    await cache.invalidate("robots")
     return robot
 
 
@@ -70,22 +92,29 @@ async def update_robot(
     robot_in: RobotUpdate,
     session: DBSession,
     current_user: OperatorUser,
+    cache: Cache,
 ) -> Robot:
     """Update robot details."""
-    result = await session.execute(select(Robot).where(Robot.id == robot_id))
+    update_data = robot_in.model_dump(exclude_unset=True)
+    if update_data:
+        result = await session.execute(
+            update(Robot)
+            .where(Robot.id == robot_id)
+            .values(**update_data)
+            .returning(Robot)
+            .execution_options(populate_existing=True)
+        )
+    else:
+        # Nothing to change, and an UPDATE with an empty SET is invalid SQL
+        result = await session.execute(select(Robot).where(Robot.id == robot_id))
     robot = result.scalar_one_or_none()
     if not robot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Robot not found",
         )
-
-    update_data = robot_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(robot, field, value)
-
-    await session.flush()
-    await session.refresh(robot)
+    await session.commit()
+    await cache.invalidate("robots")
     return robot
 
 
@@ -95,45 +124,43 @@ async def update_robot_status(
     status_in: RobotStatusUpdate,
     session: DBSession,
     current_user: OperatorUser,
-    background_tasks: BackgroundTasks,
+    cache: Cache,
 ) -> Robot:
     """Update robot status and telemetry."""
-    result = await session.execute(select(Robot).where(Robot.id == robot_id))
-    robot = result.scalar_one_or_none()
+    update_data = status_in.model_dump(exclude_unset=True)
+
+    if status_batcher.running:
+        # Hand the pooled connection (held since the auth query) back first:
+        # the batcher writes on its own connection, and requests parked here
+        # holding theirs could otherwise exhaust the pool
+        await session.commit()
+        # Coalesced with concurrent telemetry; the batcher broadcasts once
+        # per robot per flush
+        robot = await status_batcher.submit(robot_id, update_data)
+    elif update_data:
+        result = await session.execute(
+            update(Robot)
+            .where(Robot.id == robot_id)
+            .values(**update_data)
+            .returning(Robot)
+            .execution_options(populate_existing=True)
+        )
+        robot = result.scalar_one_or_none()
+        if robot:
+            # Broadcast update to WebSocket subscribers
+            broadcaster.publish(robot_id, encode_status_update(robot))
+    else:
+        # Nothing to change, and an UPDATE with an empty SET is invalid SQL
+        result = await session.execute(select(Robot).where(Robot.id == robot_id))
+        robot = result.scalar_one_or_none()
+
     if not robot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Robot not found",
         )
-
-    update_data = status_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(robot, field, value)
-
-    await session.flush()
-    await session.refresh(robot)
-
-    # Broadcast update to WebSocket subscribers
-    background_tasks.add_task(
-        manager.broadcast_robot_update,
-        robot_id,
-        {
-            "event": "status_update",
-            "robot_id": str(robot_id),
-            "robot": {
-                "id": str(robot.id),
-                "name": robot.name,
-                "serial_number": robot.serial_number,
-                "status": robot.status.value,
-                "location_x": robot.location_x,
-                "location_y": robot.location_y,
-                "location_z": robot.location_z,
-                "heading": robot.heading,
-                "battery_level": robot.battery_level,
-            },
-        },
-    )
-
+    await session.commit()
+    await cache.invalidate("robots")
     return robot
 
 
@@ -142,13 +169,17 @@ async def delete_robot(
     robot_id: UUID,
     session: DBSession,
     current_user: OperatorUser,
+    cache: Cache,
 ) -> None:
     """Remove a robot from the fleet."""
-    result = await session.execute(select(Robot).where(Robot.id == robot_id))
-    robot = result.scalar_one_or_none()
-    if not robot:
+    result = await session.execute(
+        delete(Robot).where(Robot.id == robot_id).returning(Robot.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Robot not found",
         )
-    await session.delete(robot)
+    # Missions of a deleted robot are unassigned by the foreign key
+    await session.commit()
+    await cache.invalidate("robots", "missions")
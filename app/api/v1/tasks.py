@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.api.deps import AdminUser
 from app.tasks.missions import schedule_mission, simulate_mission_progress
@@ -20,7 +20,8 @@ class CommandRequest(BaseModel):
 
 class ScheduleRequest(BaseModel):
     """Request body for scheduling missions."""
-    delay_seconds: int = 0
+    # Countdowns past the broker visibility timeout would be redelivered
+    delay_seconds: int = Field(0, ge=0, lt=3600)
 
 
 class TaskResponse(BaseModel):
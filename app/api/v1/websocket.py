@@ -1,14 +1,29 @@
+from typing import Any, cast
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from sqlalchemy import select
 
 from app.core.websocket import manager
 from app.db.session import async_session_maker
 from app.models.robot import Robot
+from app.schemas.ws import encode_connected
 
 router = APIRouter(tags=["websocket"])
 
+_PONG = orjson.dumps({"type": "pong"}).decode()
+
+
+async def _send(websocket: WebSocket, data: dict[str, Any]) -> None:
+    """Send a message as an orjson-encoded text frame."""
+    await websocket.send_text(orjson.dumps(data).decode())
+
+
+async def _receive(websocket: WebSocket) -> dict[str, Any]:
+    """Receive a JSON message from the client."""
+    return cast(dict[str, Any], orjson.loads(await websocket.receive_text()))
+
 
 @router.websocket("/ws/robots/{robot_id}")
 async def robot_status_stream(websocket: WebSocket, robot_id: UUID) -> None:
@@ -21,6 +36,8 @@ async def robot_status_stream(websocket: WebSocket, robot_id: UUID) -> None:
     - {"event": "connected", "robot_id": "...", "robot": {...}}
     - {"event": "status_update", "robot_id": "...", "robot": {...}}
     - {"event": "error", "message": "..."}
+
+    Queued updates may arrive batched in one frame, one JSON message per line.
     """
     # Verify robot exists before accepting connection
     async with async_session_maker() as session:
@@ -35,31 +52,18 @@ async def robot_status_stream(websocket: WebSocket, robot_id: UUID) -> None:
         await manager.connect(websocket, robot_id)
 
         # Send initial state
-        await websocket.send_json({
-            "event": "connected",
-            "robot_id": str(robot_id),
-            "robot": {
-                "id": str(robot.id),
-                "name": robot.name,
-                "serial_number": robot.serial_number,
-                "status": robot.status.value,
-                "location_x": robot.location_x,
-                "location_y": robot.location_y,
-                "location_z": robot.location_z,
-                "heading": robot.heading,
-                "battery_level": robot.battery_level,
-            },
-            "subscribers": manager.get_connection_count(robot_id),
-        })
+        await websocket.send_text(
+            encode_connected(robot, manager.get_connection_count(robot_id)).decode()
+        )
 
     try:
         while True:
             # Keep connection alive and handle incoming messages
-            data = await websocket.receive_json()
+            data = await _receive(websocket)
             
             # Client can send ping to keep alive
             if data.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text(_PONG)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -73,13 +77,13 @@ async def fleet_status_stream(websocket: WebSocket) -> None:
     Connect to receive updates for ALL robots in the fleet.
     """
     await websocket.accept()
-    
+
     # Get all robots for initial state
     async with async_session_maker() as session:
         result = await session.execute(select(Robot))
         robots = result.scalars().all()
         
-        await websocket.send_json({
+        await _send(websocket, {
             "event": "connected",
             "fleet_size": len(robots),
             "robots": [
@@ -93,20 +97,13 @@ async def fleet_status_stream(websocket: WebSocket) -> None:
             ],
         })
 
-    # For fleet-wide, we subscribe to a special "fleet" channel
-    # by using UUID(int=0) as a sentinel
-    from uuid import UUID as UUIDType
-    fleet_id = UUIDType(int=0)
-    
-    if fleet_id not in manager._connections:
-        manager._connections[fleet_id] = set()
-    manager._connections[fleet_id].add(websocket)
-    manager._subscriptions[websocket] = {fleet_id}
+    # Subscribe only once the snapshot is out, so no update can precede it
+    manager.subscribe_fleet(websocket)
 
     try:
         while True:
-            data = await websocket.receive_json()
+            data = await _receive(websocket)
             if data.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text(_PONG)
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        manager.disconnect_fleet(websocket)
@@ -0,0 +1,24 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.security import decode_token
+
+
+class AuthMiddleware:
+    """Decodes the bearer token once per request into ``request.state.jwt``.
+
+    The payload is None when the token is invalid or expired. Requests
+    without a bearer token leave ``jwt`` unset.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    scheme, _, token = value.decode("latin-1").partition(" ")
+                    if scheme.lower() == "bearer" and token:
+                        scope.setdefault("state", {})["jwt"] = decode_token(token)
+                    break
+        await self.app(scope, receive, send)
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from app.core.websocket import manager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Broadcaster:
+    """Single consumer that fans robot updates out to WebSocket subscribers.
+
+    Handlers publish without awaiting; bursts are coalesced so each robot
+    is broadcast at most once per drain, with its newest payload.
+    """
+
+    max_queue_size: int = 10_000
+    max_drain: int = 128
+
+    _queue: "asyncio.Queue[tuple[UUID, bytes]] | None" = field(
+        default=None, init=False
+    )
+    _task: "asyncio.Task[None] | None" = field(default=None, init=False)
+    # Updates dropped because the queue was full
+    dropped: int = field(default=0, init=False)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the broadcast loop on the running event loop."""
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the broadcast loop, dropping anything not yet sent."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._queue = None
+
+    def publish(self, robot_id: UUID, payload: bytes) -> None:
+        """Queue an encoded update for a robot's subscribers."""
+        # Without the loop there is no server accepting WebSocket clients
+        if self._queue is None:
+            return
+        try:
+            self._queue.put_nowait((robot_id, payload))
+        except asyncio.QueueFull:
+            # A newer update for the robot will follow; drop this one
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    "Broadcast queue full; %d updates dropped so far", self.dropped
+                )
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            robot_id, payload = await self._queue.get()
+            latest = {robot_id: payload}
+            for _ in range(self.max_drain - 1):
+                if self._queue.empty():
+                    break
+                robot_id, payload = self._queue.get_nowait()
+                latest[robot_id] = payload
+
+            for robot_id, payload in latest.items():
+                await manager.broadcast_robot_update(robot_id, payload)
+
+
+# Global instance
+broadcaster = Broadcaster()
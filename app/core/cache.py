@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Any, cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResponseCache:
+    """Short-lived Redis cache for serialized list responses.
+
+    Keys are tracked in a per-namespace index set so a namespace can be
+    invalidated without scanning the keyspace. Redis errors are logged and
+    treated as cache misses so the API keeps serving from the database.
+    """
+
+    redis: Redis | None
+    prefix: str = "rf"
+    expire: int = 10  # seconds
+
+    def key(self, namespace: str, **params: Any) -> str:
+        """Build a cache key from the query parameters of a request."""
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"{self.prefix}:{namespace}:{digest}"
+
+    def _index(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:keys"
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached payload, or None on a miss."""
+        if self.redis is None:
+            return None
+        try:
+            payload: bytes | None = await self.redis.get(key)
+            return payload
+        except RedisError:
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            return None
+
+    async def set(self, namespace: str, key: str, value: bytes) -> None:
+        """Store a payload and register it for namespace invalidation."""
+        if self.redis is None:
+            return
+        index = self._index(namespace)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, value, ex=self.expire)
+                pipe.sadd(index, key)
+                pipe.expire(index, self.expire)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Cache write failed for %s", key, exc_info=True)
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """Drop every cached payload in the given namespaces.
+
+        Call this only after the change is committed; otherwise a concurrent
+        read can re-cache the old rows for the full expiry.
+        """
+        if self.redis is None:
+            return
+        try:
+            for namespace in namespaces:
+                index = self._index(namespace)
+                keys = await cast(
+                    Awaitable[set[bytes]], self.redis.smembers(index)
+                )
+                await self.redis.delete(index, *keys)
+        except RedisError:
+            logger.warning("Cache invalidation failed", exc_info=True)
+
+
+# Global instance
+response_cache = ResponseCache(
+    Redis.from_url(settings.redis_url), expire=settings.response_cache_expire
+)
+
+
+def get_response_cache() -> ResponseCache:
+    """Dependency that provides the response cache."""
+    return response_cache
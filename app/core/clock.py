@@ -0,0 +1,57 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class Clock:
+    """UTC wall clock refreshed by a ticker task, for coarse timestamps.
+
+    Readings may lag real time by up to ``interval``; use
+    ``datetime.now(timezone.utc)`` where sub-second precision matters.
+    """
+
+    interval: float = 0.25  # seconds
+
+    _now: datetime = field(default_factory=_utcnow, init=False)
+    _task: "asyncio.Task[None] | None" = field(default=None, init=False)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the ticker on the running event loop."""
+        self._now = _utcnow()
+        self._task = asyncio.create_task(self._tick())
+
+    async def stop(self) -> None:
+        """Stop the ticker; readings fall back to the real clock."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def now(self) -> datetime:
+        """Current UTC time, from the cache while the ticker runs."""
+        if self._task is None:
+            return _utcnow()
+        return self._now
+
+    async def _tick(self) -> None:
+        while True:
+            self._now = _utcnow()
+            await asyncio.sleep(self.interval)
+
+
+# Global instance
+clock = Clock()
+now_utc = clock.now
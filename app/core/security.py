@@ -1,25 +1,66 @@
+import asyncio
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import bcrypt
-from jose import jwt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from app.core.config import settings
 
+# Argon2id with OWASP-recommended parameters (64 MiB, t=3, p=2)
+_ph = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=2)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash."""
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"),
-        hashed_password.encode("utf-8"),
+# Hashes created before the switch to Argon2id
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Verified against when a login email is unknown, so both paths cost the same
+_DUMMY_HASH = _ph.hash("!invalid-sentinel!")
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
+    try:
+        return _ph.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await asyncio.to_thread(
+        _verify_password_sync, plain_password, hashed_password
     )
 
 
-def hash_password(password: str) -> str:
-    """Hash a password."""
-    return bcrypt.hashpw(
-        password.encode("utf-8"),
-        bcrypt.gensalt(),
-    ).decode("utf-8")
+async def verify_password_or_dummy(
+    plain_password: str, hashed_password: str | None
+) -> bool:
+    """Verify a password, burning equal time on a dummy hash if there is none."""
+    verified = await verify_password(plain_password, hashed_password or _DUMMY_HASH)
+    return verified and hashed_password is not None
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with Argon2id without blocking the event loop."""
+    return await asyncio.to_thread(_ph.hash, password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash is legacy bcrypt or uses outdated Argon2 params."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    try:
+        return _ph.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
 
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
@@ -35,12 +76,37 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
-def decode_token(token: str) -> dict | None:
-    """Decode and validate a JWT token."""
+# Decoded token payloads keyed by token digest: digest -> (expires_at, payload)
+_TOKEN_CACHE: dict[bytes, tuple[float, dict[str, Any]]] = {}
+_TOKEN_CACHE_MAX_SIZE = 1024
+_TOKEN_CACHE_TTL = 60.0  # seconds
+
+
+def decode_token(token: str) -> dict[str, Any] | None:
+    """Decode and validate a JWT token.
+
+    Verified payloads are cached for up to a minute (never past the token's
+    own expiry) so repeat requests skip signature verification.
+    """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > now:
+            return payload
+        del _TOKEN_CACHE[key]
+
     try:
         payload = jwt.decode(
             token, settings.secret_key, algorithms=[settings.algorithm]
         )
-        return payload
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         return None
+
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+        # Evict the oldest entry
+        del _TOKEN_CACHE[next(iter(_TOKEN_CACHE))]
+    _TOKEN_CACHE[key] = (min(payload.get("exp", now), now + _TOKEN_CACHE_TTL), payload)
+    return payload
@@ -0,0 +1,179 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import case, literal, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.broadcaster import broadcaster
+from app.db.session import async_session_maker
+from app.models.robot import Robot
+from app.schemas.ws import encode_status_update
+
+# A queued status update: robot id, changed fields, and the waiting handler
+_Pending = tuple[UUID, dict[str, Any], "asyncio.Future[Robot | None]"]
+
+
+async def write_status_updates(
+    session: AsyncSession, updates: dict[UUID, dict[str, Any]]
+) -> dict[UUID, Robot]:
+    """Apply per-robot field updates in a single UPDATE ... RETURNING.
+
+    Robots with no changed fields are read back with a SELECT instead.
+    """
+    robots: dict[UUID, Robot] = {}
+    changed = {robot_id: values for robot_id, values in updates.items() if values}
+    unchanged = [robot_id for robot_id, values in updates.items() if not values]
+
+    if changed:
+        columns = {name for values in changed.values() for name in values}
+        assignments = {}
+        for name in columns:
+            column = getattr(Robot, name)
+            whens = {
+                robot_id: literal(values[name], column.type)
+                for robot_id, values in changed.items()
+                if name in values
+            }
+            assignments[name] = case(whens, value=Robot.id, else_=column)
+
+        result = await session.execute(
+            update(Robot)
+            .where(Robot.id.in_(changed))
+            .values(**assignments)
+            .returning(Robot)
+            .execution_options(populate_existing=True)
+        )
+        robots.update((robot.id, robot) for robot in result.scalars())
+
+    if unchanged:
+        result = await session.execute(select(Robot).where(Robot.id.in_(unchanged)))
+        robots.update((robot.id, robot) for robot in result.scalars())
+
+    return robots
+
+
+def _fail_stopped(batch: list[_Pending]) -> None:
+    for _, _, future in batch:
+        if not future.done():
+            future.set_exception(RuntimeError("Status batcher stopped"))
+
+
+@dataclass
+class StatusBatcher:
+    """Coalesces high-rate robot status updates into batched writes."""
+
+    max_batch_size: int = 32
+    max_wait: float = 0.02  # seconds
+    session_maker: async_sessionmaker[AsyncSession] = async_session_maker
+
+    _queue: "asyncio.Queue[_Pending] | None" = field(default=None, init=False)
+    _task: "asyncio.Task[None] | None" = field(default=None, init=False)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush loop on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop, failing any updates in flight or still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        queue, self._queue = self._queue, None
+        while queue is not None and not queue.empty():
+            _fail_stopped([queue.get_nowait()])
+
+    async def submit(self, robot_id: UUID, values: dict[str, Any]) -> Robot | None:
+        """Queue an update and wait for the flushed row (None if not found)."""
+        if self._queue is None:
+            raise RuntimeError("Status batcher is not running")
+        future: asyncio.Future[Robot | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._queue.put_nowait((robot_id, values, future))
+        return await future
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        batch: list[_Pending] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout)
+                        )
+                    except TimeoutError:
+                        break
+                await self._flush(batch)
+        except asyncio.CancelledError:
+            # Don't leave the handlers of a half-collected or half-written
+            # batch waiting forever
+            _fail_stopped(batch)
+            raise
+
+    async def _write(self, updates: dict[UUID, dict[str, Any]]) -> dict[UUID, Robot]:
+        async with self.session_maker() as session:
+            robots = await write_status_updates(session, updates)
+            await session.commit()
+        return robots
+
+    async def _flush(self, batch: list[_Pending]) -> None:
+        # Later updates for the same robot win field-by-field
+        merged: dict[UUID, dict[str, Any]] = {}
+        for robot_id, values, _ in batch:
+            merged.setdefault(robot_id, {}).update(values)
+
+        robots: dict[UUID, Robot] = {}
+        errors: dict[UUID, Exception] = {}
+        try:
+            robots = await self._write(merged)
+        except Exception as exc:
+            # Only a database error can be down to one row; anything else
+            # (e.g. a pool timeout) would just recur on every retry
+            if len(merged) == 1 or not isinstance(exc, DBAPIError):
+                errors = dict.fromkeys(merged, exc)
+            else:
+                # Retry robot by robot so one bad row (e.g. a NULL status)
+                # only fails the requests for that robot
+                for robot_id, values in merged.items():
+                    try:
+                        robots.update(await self._write({robot_id: values}))
+                    except Exception as robot_exc:
+                        errors[robot_id] = robot_exc
+
+        for robot_id, _, future in batch:
+            if future.done():
+                continue
+            if robot_id in errors:
+                future.set_exception(errors[robot_id])
+            else:
+                future.set_result(robots.get(robot_id))
+
+        # One broadcast per changed robot, however many updates were coalesced
+        for robot_id, robot in robots.items():
+            if merged[robot_id]:
+                broadcaster.publish(robot_id, encode_status_update(robot))
+
+
+# Global instance
+status_batcher = StatusBatcher()
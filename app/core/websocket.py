@@ -1,8 +1,23 @@
+import asyncio
 from dataclasses import dataclass, field
+from typing import Any
 from uuid import UUID
 
+import orjson
 from fastapi import WebSocket
 
+# Messages buffered per client before the oldest are dropped
+OUTBOX_SIZE = 64
+# Most queued messages merged into a single newline-delimited frame
+MAX_FRAME_MESSAGES = 64
+
+
+def _to_text(data: dict[str, Any] | bytes) -> str:
+    """Encode a message as a JSON text frame."""
+    if isinstance(data, bytes):
+        return data.decode("utf-8")
+    return orjson.dumps(data).decode("utf-8")
+
 
 @dataclass
 class ConnectionManager:
@@ -12,6 +27,11 @@ class ConnectionManager:
     _connections: dict[UUID, set[WebSocket]] = field(default_factory=dict)
     # websocket -> set of robot_ids it's subscribed to
     _subscriptions: dict[WebSocket, set[UUID]] = field(default_factory=dict)
+    # websockets subscribed to fleet-wide events
+    _fleet_subs: set[WebSocket] = field(default_factory=set)
+    # websocket -> pending outbound messages, drained by its sender task
+    _outboxes: dict[WebSocket, asyncio.Queue[str]] = field(default_factory=dict)
+    _senders: dict[WebSocket, asyncio.Task[None]] = field(default_factory=dict)
 
     async def connect(self, websocket: WebSocket, robot_id: UUID) -> None:
         """Accept connection and subscribe to robot updates."""
@@ -25,6 +45,10 @@ class ConnectionManager:
             self._subscriptions[websocket] = set()
         self._subscriptions[websocket].add(robot_id)
 
+    def subscribe_fleet(self, websocket: WebSocket) -> None:
+        """Subscribe an accepted connection to fleet-wide updates."""
+        self._fleet_subs.add(websocket)
+
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove connection and all its subscriptions."""
         if websocket in self._subscriptions:
@@ -34,38 +58,66 @@ class ConnectionManager:
                     if not self._connections[robot_id]:
                         del self._connections[robot_id]
             del self._subscriptions[websocket]
+        self._fleet_subs.discard(websocket)
+        self._close_outbox(websocket)
+
+    def disconnect_fleet(self, websocket: WebSocket) -> None:
+        """Remove a fleet-wide subscriber."""
+        self._fleet_subs.discard(websocket)
+        self._close_outbox(websocket)
+
+    def _close_outbox(self, websocket: WebSocket) -> None:
+        self._outboxes.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+
+    def _enqueue(self, websocket: WebSocket, message: str) -> None:
+        """Queue a message for a client, dropping its oldest if it lags."""
+        outbox = self._outboxes.get(websocket)
+        if outbox is None:
+            outbox = self._outboxes[websocket] = asyncio.Queue(maxsize=OUTBOX_SIZE)
+            self._senders[websocket] = asyncio.create_task(
+                self._send_loop(websocket, outbox)
+            )
+        if outbox.full():
+            outbox.get_nowait()
+        outbox.put_nowait(message)
+
+    async def _send_loop(
+        self, websocket: WebSocket, outbox: asyncio.Queue[str]
+    ) -> None:
+        try:
+            while True:
+                # A client that fell behind gets its backlog in one frame
+                batch = [await outbox.get()]
+                while not outbox.empty() and len(batch) < MAX_FRAME_MESSAGES:
+                    batch.append(outbox.get_nowait())
+                await websocket.send_text("\n".join(batch))
+        except Exception:
+            # Clean up dead connection
+            self.disconnect(websocket)
+
+    async def broadcast_robot_update(
+        self, robot_id: UUID, data: dict[str, Any] | bytes
+    ) -> None:
+        """Send update to all clients subscribed to this robot.
 
-    async def broadcast_robot_update(self, robot_id: UUID, data: dict) -> None:
-        """Send update to all clients subscribed to this robot."""
+        ``data`` may be a dict or an already-encoded JSON payload.
+        """
         if robot_id not in self._connections:
             return
 
-        dead_connections = []
-        for websocket in self._connections[robot_id]:
-            try:
-                await websocket.send_json(data)
-            except Exception:
-                dead_connections.append(websocket)
+        # Encode once, then hand the same text frame to every subscriber
+        message = _to_text(data)
+        for websocket in tuple(self._connections[robot_id]):
+            self._enqueue(websocket, message)
 
-        # Clean up dead connections
-        for websocket in dead_connections:
-            self.disconnect(websocket)
-
-    async def broadcast_fleet_update(self, data: dict) -> None:
-        """Send update to ALL connected clients (fleet-wide events)."""
-        all_websockets = set()
-        for websocket_set in self._connections.values():
-            all_websockets.update(websocket_set)
-
-        dead_connections = []
-        for websocket in all_websockets:
-            try:
-                await websocket.send_json(data)
-            except Exception:
-                dead_connections.append(websocket)
-
-        for websocket in dead_connections:
-            self.disconnect(websocket)
+    async def broadcast_fleet_update(self, data: dict[str, Any] | bytes) -> None:
+        """Send update to all fleet subscribers."""
+        message = _to_text(data)
+        for websocket in tuple(self._fleet_subs):
+            self._enqueue(websocket, message)
 
     def get_connection_count(self, robot_id: UUID | None = None) -> int:
         """Get number of active connections."""
@@ -1,6 +1,19 @@
-from datetime import datetime, timezone
+import enum
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime
+from sqlalchemy import (
+    Connection,
+    DateTime,
+    Dialect,
+    FetchedValue,
+    MetaData,
+    SmallInteger,
+    TypeDecorator,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -10,17 +23,89 @@ class Base(DeclarativeBase):
     pass
 
 
+class EnumInt(TypeDecorator[enum.Enum]):
+    """Stores an enum as a SMALLINT code: the member's definition index.
+
+    Codes are positional, so new members must only ever be appended.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[enum.Enum]) -> None:
+        super().__init__()
+        self.enum_cls = enum_cls
+        self._members = list(enum_cls)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        # Accepts members or their raw values
+        return self._codes[self.enum_cls(value)]
+
+    def process_literal_param(self, value: Any, dialect: Dialect) -> str:
+        return str(self.process_bind_param(value, dialect))
+
+    def process_result_value(
+        self, value: int | None, dialect: Dialect
+    ) -> enum.Enum | None:
+        if value is None:
+            return None
+        return self._members[value]
+
+
 class TimestampMixin:
-    """Mixin for created_at and updated_at timestamps."""
+    """Mixin for created_at and updated_at timestamps.
 
+    Both are set by Postgres: defaults on INSERT, and the set_updated_at
+    trigger on UPDATE.
+    """
+
+    # statement_timestamp() rather than now(), so rows inserted by separate
+    # statements in one transaction still sort in creation order
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.statement_timestamp(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.statement_timestamp(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
+
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = statement_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_updated_at_triggers(
+    target: MetaData, connection: Connection, **kw: Any
+) -> None:
+    """Install the updated_at trigger on tables built with create_all."""
+    connection.execute(text(SET_UPDATED_AT_FUNCTION))
+    for table in kw["tables"]:
+        if "updated_at" in table.c:
+            connection.execute(
+                text(
+                    f"CREATE TRIGGER {table.name}_set_updated_at "
+                    f"BEFORE UPDATE ON {table.name} "
+                    "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+                )
+            )
+
+
+@event.listens_for(Base.metadata, "after_drop")
+def _drop_updated_at_function(
+    target: MetaData, connection: Connection, **kw: Any
+) -> None:
+    connection.execute(text("DROP FUNCTION IF EXISTS set_updated_at()"))
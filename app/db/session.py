@@ -1,9 +1,11 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import contextmanager
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
@@ -12,6 +14,21 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    # Reuse the most recently returned connection so surplus ones can idle out
+    pool_use_lifo=True,
+    connect_args={
+        # Short OLTP queries never benefit from JIT compilation
+        "server_settings": {"jit": "off"},
+        # asyncpg's statement cache and SQLAlchemy's prepared statement
+        # cache, so hot queries are parsed and planned once per connection
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    },
 )
 
 # Create async session factory
@@ -42,6 +59,16 @@ sync_session_maker = sessionmaker(
 )
 
 
+async def warm_up_pool() -> None:
+    """Open the pool's connections up front so early requests don't pay for it."""
+
+    async def checkout() -> None:
+        async with engine.connect():
+            pass
+
+    await asyncio.gather(*(checkout() for _ in range(settings.db_pool_size)))
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides an async database session (for FastAPI)."""
     async with async_session_maker() as session:
@@ -5,7 +5,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import auth, missions, robots, tasks, websocket
+from app.core.auth_middleware import AuthMiddleware
+from app.core.broadcaster import broadcaster
+from app.core.cache import response_cache
+from app.core.clock import clock
 from app.core.config import settings
+from app.core.status_batcher import status_batcher
+from app.db.session import engine, warm_up_pool
 
 
 @asynccontextmanager
@@ -13,8 +19,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler."""
     # Startup
     print(f"🚀 Starting {settings.app_name}")
+    await warm_up_pool()
+    clock.start()
+    broadcaster.start()
+    status_batcher.start()
     yield
     # Shutdown
+    await status_batcher.stop()
+    await broadcaster.stop()
+    await clock.stop()
+    if response_cache.redis is not None:
+        await response_cache.redis.aclose()
+    await engine.dispose()
     print(f"👋 Shutting down {settings.app_name}")
 
 
@@ -27,6 +43,9 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# Middleware added last runs first, so CORS wraps auth
+app.add_middleware(AuthMiddleware)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -2,11 +2,11 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, EnumInt, TimestampMixin
 
 
 class MissionStatus(str, enum.Enum):
@@ -20,6 +20,11 @@ class MissionStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+# Missions not yet started: they may be (re)assigned to a robot, and the
+# scheduler may start them once scheduled_at has passed
+SCHEDULABLE_STATUSES = (MissionStatus.PENDING, MissionStatus.ASSIGNED)
+
+
 class MissionPriority(str, enum.Enum):
     """Mission priority level."""
 
@@ -37,16 +42,19 @@ class Mission(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     status: Mapped[MissionStatus] = mapped_column(
-        Enum(MissionStatus), nullable=False, default=MissionStatus.PENDING
+        EnumInt(MissionStatus),
+        nullable=False,
+        default=MissionStatus.PENDING,
+        index=True,
     )
     priority: Mapped[MissionPriority] = mapped_column(
-        Enum(MissionPriority), nullable=False, default=MissionPriority.NORMAL
+        EnumInt(MissionPriority), nullable=False, default=MissionPriority.NORMAL
     )
 
     # Target location
@@ -80,4 +88,18 @@ class Mission(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        return f"<Mission {self.name} ({self.status.value})>"
+        # Read only loaded attributes so repr never triggers a lazy load
+        loaded = self.__dict__
+        status = loaded["status"].value if "status" in loaded else "?"
+        return f"<Mission {loaded.get('name', '?')} ({status})>"
+
+
+# Keyset pagination: newest first, id as tie-breaker
+Index("ix_missions_created_id", Mission.created_at.desc(), Mission.id.desc())
+
+# Scheduler scan; the partial predicate must match process_scheduled_missions
+Index(
+    "ix_missions_schedulable_scheduled_at",
+    Mission.scheduled_at,
+    postgresql_where=Mission.status.in_(SCHEDULABLE_STATUSES),
+)
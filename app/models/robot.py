@@ -1,11 +1,11 @@
 import enum
 import uuid
 
-from sqlalchemy import Enum, Float, String, Text
+from sqlalchemy import Float, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, EnumInt, TimestampMixin
 
 
 class RobotStatus(str, enum.Enum):
@@ -37,17 +37,17 @@ class Robot(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     serial_number: Mapped[str] = mapped_column(
         String(50), unique=True, nullable=False, index=True
     )
     robot_type: Mapped[RobotType] = mapped_column(
-        Enum(RobotType), nullable=False, default=RobotType.AMR
+        EnumInt(RobotType), nullable=False, default=RobotType.AMR
     )
     status: Mapped[RobotStatus] = mapped_column(
-        Enum(RobotStatus), nullable=False, default=RobotStatus.OFFLINE
+        EnumInt(RobotStatus), nullable=False, default=RobotStatus.OFFLINE
     )
 
     # Location
@@ -61,10 +61,17 @@ class Robot(Base, TimestampMixin):
     battery_level: Mapped[float | None] = mapped_column(Float, nullable=True)  # 0-100
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    # Relationships
+    # Relationships. Never loaded implicitly; queries that need missions
+    # must opt in with selectinload(Robot.missions)
     missions: Mapped[list["Mission"]] = relationship(  # noqa: F821
-        "Mission", back_populates="robot", lazy="selectin"
+        "Mission", back_populates="robot", lazy="raise_on_sql"
     )
 
     def __repr__(self) -> str:
-        return f"<Robot {self.name} ({self.serial_number})>"
+        # Read only loaded attributes so repr never triggers a lazy load
+        loaded = self.__dict__
+        return f"<Robot {loaded.get('name', '?')} ({loaded.get('serial_number', '?')})>"
+
+
+# Keyset pagination: newest first, id as tie-breaker
+Index("ix_robots_created_id", Robot.created_at.desc(), Robot.id.desc())
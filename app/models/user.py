@@ -1,11 +1,11 @@
 import enum
 import uuid
 
-from sqlalchemy import Boolean, Enum, String
+from sqlalchemy import Boolean, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, EnumInt, TimestampMixin
 
 
 class UserRole(str, enum.Enum):
@@ -20,11 +20,15 @@ class User(Base, TimestampMixin):
     """User account for API access."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Lets get_current_user read id/is_active/role with an index-only scan
+        Index("ix_users_id_auth", "id", postgresql_include=["is_active", "role"]),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     email: Mapped[str] = mapped_column(
         String(255), unique=True, nullable=False, index=True
@@ -33,9 +37,14 @@ class User(Base, TimestampMixin):
     full_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
     role: Mapped[UserRole] = mapped_column(
-        Enum(UserRole), nullable=False, default=UserRole.VIEWER
+        EnumInt(UserRole), nullable=False, default=UserRole.VIEWER
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     def __repr__(self) -> str:
-        return f"<User {self.email}>"
+        # Read only loaded attributes so repr never triggers a lazy load
+        return f"<User {self.__dict__.get('email', '?')}>"
+
+
+# Case-insensitive uniqueness, used by login/register lookups
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
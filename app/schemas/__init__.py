@@ -3,6 +3,7 @@ from app.schemas.mission import (
     MissionRead,
     MissionUpdate,
 )
+from app.schemas.pagination import Page
 from app.schemas.robot import (
     RobotCreate,
     RobotRead,
@@ -10,6 +11,7 @@ from app.schemas.robot import (
     RobotUpdate,
 )
 from app.schemas.user import Token, UserCreate, UserRead
+from app.schemas.ws import RobotState, RobotStatusMsg
 
 __all__ = [
     "RobotCreate",
@@ -19,7 +21,10 @@ __all__ = [
     "MissionCreate",
     "MissionRead",
     "MissionUpdate",
+    "Page",
     "UserCreate",
     "UserRead",
     "Token",
+    "RobotState",
+    "RobotStatusMsg",
 ]
@@ -0,0 +1,60 @@
+from operator import attrgetter
+from uuid import UUID
+
+import msgspec
+
+from app.models.robot import Robot, RobotStatus
+
+
+class RobotState(msgspec.Struct):
+    """Robot fields included in real-time status messages."""
+
+    id: UUID
+    name: str
+    serial_number: str
+    status: RobotStatus
+    location_x: float | None
+    location_y: float | None
+    location_z: float | None
+    heading: float | None
+    battery_level: float | None
+
+
+class RobotConnectedMsg(msgspec.Struct):
+    """WebSocket message sent when a client subscribes to a robot."""
+
+    event: str
+    robot_id: UUID
+    robot: RobotState
+    subscribers: int
+
+
+class RobotStatusMsg(msgspec.Struct):
+    """WebSocket message sent when a robot's status changes."""
+
+    event: str
+    robot_id: UUID
+    robot: RobotState
+
+
+_get_state = attrgetter(*RobotState.__struct_fields__)
+_encoder = msgspec.json.Encoder()
+
+
+def robot_state(robot: Robot) -> RobotState:
+    """Snapshot the real-time fields of a robot."""
+    return RobotState(*_get_state(robot))
+
+
+def encode_connected(robot: Robot, subscribers: int) -> bytes:
+    """Encode the connected message for a robot's new subscriber."""
+    return _encoder.encode(
+        RobotConnectedMsg("connected", robot.id, robot_state(robot), subscribers)
+    )
+
+
+def encode_status_update(robot: Robot) -> bytes:
+    """Encode a status_update message for a robot straight to JSON bytes."""
+    return _encoder.encode(
+        RobotStatusMsg("status_update", robot.id, robot_state(robot))
+    )
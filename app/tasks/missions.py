@@ -1,4 +1,8 @@
-"""Background tasks for mission management."""
+"""Background tasks for mission management.
+
+Workers ack late, so a task interrupted by a worker crash runs again.
+Tasks here must stay idempotent: re-check mission state before acting.
+"""
 
 from datetime import datetime, timezone
 from uuid import UUID
@@ -6,7 +10,7 @@ from uuid import UUID
 from sqlalchemy import select
 
 from app.db.session import get_sync_session
-from app.models.mission import Mission, MissionStatus
+from app.models.mission import SCHEDULABLE_STATUSES, Mission, MissionStatus
 from app.models.robot import Robot, RobotStatus
 from app.worker import celery_app
 
@@ -33,7 +37,7 @@ def process_scheduled_missions() -> dict:
         result = session.execute(
             select(Mission).where(
                 Mission.scheduled_at <= now,
-                Mission.status.in_([MissionStatus.PENDING, MissionStatus.ASSIGNED]),
+                Mission.status.in_(SCHEDULABLE_STATUSES),
             )
         )
         missions = result.scalars().all()
@@ -15,22 +15,50 @@ celery_app = Celery(
 # Celery configuration
 celery_app.conf.update(
     # Task settings
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
     timezone="UTC",
     enable_utc=True,
     
     # Task execution settings
     task_track_started=True,
     task_time_limit=300,  # 5 minutes max per task
+    # Ack after the task finishes so a crashed worker's task is redelivered.
+    # Tasks must therefore be safe to run more than once.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    
+    # Broker settings. Unacked tasks (including countdown/ETA ones) are
+    # redelivered after the visibility timeout, so it must exceed both the
+    # longest task and the longest scheduling delay.
+    broker_transport_options={"visibility_timeout": 3600},
+    broker_pool_limit=50,
+    broker_connection_retry_on_startup=True,
     
     # Result backend settings
     result_expires=3600,  # Results expire after 1 hour
+    result_backend_transport_options={
+        "visibility_timeout": 3600,
+        "retry_policy": {"timeout": 5.0},
+    },
+    redis_max_connections=100,
+    
+    # Routing. Short robot tasks and long mission tasks go to separate
+    # queues so each worker pool can be tuned for its workload:
+    #   celery -A app.worker worker -Q robots_fast --prefetch-multiplier=8 -c 4
+    #   celery -A app.worker worker -Q missions_slow --prefetch-multiplier=1 -c 2
+    task_routes={
+        "app.tasks.robots.*": {"queue": "robots_fast"},
+        "app.tasks.missions.*": {"queue": "missions_slow"},
+    },
     
     # Worker settings
-    worker_prefetch_multiplier=1,  # Fair scheduling
+    worker_prefetch_multiplier=1,  # Fair scheduling; fast workers override
     worker_concurrency=4,
+    # Recycle pool children to bound RSS; acks_late keeps their work safe
+    worker_max_tasks_per_child=200,
+    worker_max_memory_per_child=512_000,  # KiB
     
     # Beat schedule (periodic tasks)
     beat_schedule={
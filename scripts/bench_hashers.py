@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Compare password verify cost of legacy bcrypt hashes and Argon2id."""
+
+import sys
+import time
+from pathlib import Path
+
+import bcrypt
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.security import _ph, _verify_password_sync  # noqa: E402
+
+PASSWORD = "correct horse battery staple"
+
+
+def bench(label: str, hashed: str, rounds: int) -> None:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        assert _verify_password_sync(PASSWORD, hashed)
+    per_verify = (time.perf_counter() - start) / rounds * 1000
+    print(f"{label:<10} {per_verify:8.2f} ms/verify")
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    bench("bcrypt", bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt()).decode(), rounds)
+    bench("argon2id", _ph.hash(PASSWORD), rounds)
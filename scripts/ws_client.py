@@ -1,22 +1,49 @@
 #!/usr/bin/env python3
-"""Simple WebSocket client for testing robot status updates."""
+"""Simple WebSocket client for testing robot status updates.
+
+The server may batch queued updates into one frame as newline-delimited
+JSON; each line is printed as its own message.
+"""
 
 import asyncio
 import sys
 
 import websockets
 
+try:
+    import uvloop
+except ImportError:  # e.g. Windows; fall back to the default loop
+    uvloop = None
+
+# How long to keep collecting frames before printing a batch
+BATCH_WINDOW = 0.01  # seconds
+PREFIX = "📡 Received: ".encode()
+
 
 async def listen(robot_id: str):
     uri = f"ws://localhost:8000/ws/robots/{robot_id}"
     print(f"Connecting to {uri}...")
 
-    async with websockets.connect(uri) as ws:
-        print("Connected! Waiting for updates...\n")
-        
+    # Local diagnostics: skip deflate and allow large frames
+    async with websockets.connect(uri, compression=None, max_size=2**20) as ws:
+        print("Connected! Waiting for updates...\n", flush=True)
+        out = sys.stdout.buffer
+
         while True:
-            message = await ws.recv()
-            print(f"📡 Received: {message}\n")
+            # decode=False hands back raw bytes, skipping UTF-8 validation
+            batch = [await ws.recv(decode=False)]
+            try:
+                while True:
+                    batch.append(
+                        await asyncio.wait_for(ws.recv(decode=False), BATCH_WINDOW)
+                    )
+            except TimeoutError:
+                pass
+
+            for frame in batch:
+                for message in frame.split(b"\n"):
+                    out.write(PREFIX + message + b"\n\n")
+            out.flush()
 
 
 if __name__ == "__main__":
@@ -25,4 +52,5 @@ if __name__ == "__main__":
         sys.exit(1)
 
     robot_id = sys.argv[1]
-    asyncio.run(listen(robot_id))
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(listen(robot_id))
@@ -1,15 +1,15 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.cache import ResponseCache, get_response_cache
 from app.core.security import hash_password
 from app.db.base import Base
 from app.db.session import get_session
@@ -20,20 +20,45 @@ from app.models.user import User, UserRole
 # Use test database
 TEST_DATABASE_URL = "postgresql+asyncpg://postgres:postgres@db:5432/openmotiv_test"
 
+# Built once; executed with a list of rows it becomes a single multi-row INSERT
+INSERT_ROBOTS = insert(Robot).returning(Robot)
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for the test session."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    yield loop
-    loop.close()
 
+async def bulk_insert_robots(
+    session: AsyncSession, rows: list[dict[str, Any]]
+) -> list[Robot]:
+    """Insert robots in one statement, skipping the ORM unit of work.
 
-@pytest_asyncio.fixture
+    RETURNING hydrates the instances (including server-generated columns)
+    and places them in the session's identity map.
+    """
+    result = await session.execute(INSERT_ROBOTS, rows)
+    return list(result.scalars())
+
+
+# Argon2 is deliberately slow, so each test password is hashed once per session
+_PASSWORD_HASHES: dict[str, str] = {}
+
+
+async def cached_password_hash(password: str) -> str:
+    """Hash a password, reusing the result for every later call."""
+    if password not in _PASSWORD_HASHES:
+        _PASSWORD_HASHES[password] = await hash_password(password)
+    return _PASSWORD_HASHES[password]
+
+
+@pytest_asyncio.fixture(scope="session")
 async def db_engine():
-    """Create a test database engine."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    """Create a test database engine and schema once per session."""
+    # Each test checks out a single connection; LIFO keeps reusing the warm one
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        pool_size=5,
+        max_overflow=5,
+        pool_use_lifo=True,
+        connect_args={"server_settings": {"jit": "off"}},
+    )
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
@@ -44,28 +69,50 @@ async def db_engine():
 
 @pytest_asyncio.fixture
 async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a database session."""
-    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
-    async with session_maker() as session:
-        yield session
+    """Create a database session whose changes are rolled back after the test.
+
+    The session joins an outer transaction on a dedicated connection, and
+    commits only release a SAVEPOINT inside it.
+    """
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        session_maker = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with session_maker() as session:
+            yield session
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one HTTP client shared by every test in the session."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as ac:
+        yield ac
 
 
 @pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client."""
+async def client(
+    http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """Create a test client bound to this test's database session."""
 
     async def override_get_session():
         yield db_session
 
     app.dependency_overrides[get_session] = override_get_session
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as ac:
-        yield ac
-
-    app.dependency_overrides.clear()
+    # Disable response caching so tests always see the current database state
+    app.dependency_overrides[get_response_cache] = lambda: ResponseCache(redis=None)
+    try:
+        yield http_client
+    finally:
+        app.dependency_overrides.clear()
 
 
 @pytest_asyncio.fixture
@@ -74,13 +121,12 @@ async def test_user(db_session: AsyncSession) -> User:
     user = User(
         id=uuid4(),
         email="test@example.com",
-        hashed_password=hash_password("testpassword123"),
+        hashed_password=await cached_password_hash("testpassword123"),
         full_name="Test User",
         role=UserRole.OPERATOR,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     return user
 
 
@@ -90,33 +136,50 @@ async def admin_user(db_session: AsyncSession) -> User:
     user = User(
         id=uuid4(),
         email="admin@example.com",
-        hashed_password=hash_password("adminpassword123"),
+        hashed_password=await cached_password_hash("adminpassword123"),
         full_name="Admin User",
         role=UserRole.ADMIN,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     return user
 
 
 @pytest_asyncio.fixture
 async def test_robot(db_session: AsyncSession) -> Robot:
     """Create a test robot."""
-    robot = Robot(
-        id=uuid4(),
-        name="Test Robot",
-        serial_number=f"TEST-{uuid4().hex[:8].upper()}",
-        robot_type=RobotType.AMR,
-        status=RobotStatus.IDLE,
-        battery_level=100.0,
+    [robot] = await bulk_insert_robots(
+        db_session,
+        [
+            {
+                "name": "Test Robot",
+                "serial_number": f"TEST-{uuid4().hex[:8].upper()}",
+                "robot_type": RobotType.AMR,
+                "status": RobotStatus.IDLE,
+                "battery_level": 100.0,
+            }
+        ],
     )
-    db_session.add(robot)
-    await db_session.commit()
-    await db_session.refresh(robot)
     return robot
 
 
+@pytest_asyncio.fixture
+async def robot_fleet(db_session: AsyncSession) -> list[Robot]:
+    """Create a fleet of 50 robots."""
+    return await bulk_insert_robots(
+        db_session,
+        [
+            {
+                "name": f"Fleet Robot {i}",
+                "serial_number": f"FLEET-{i:04d}",
+                "robot_type": RobotType.AMR,
+                "status": RobotStatus.IDLE,
+            }
+            for i in range(50)
+        ],
+    )
+
+
 @pytest_asyncio.fixture
 async def auth_headers(client: AsyncClient, test_user: User) -> dict[str, str]:
     """Get authentication headers."""
@@ -1,8 +1,17 @@
 """Tests for authentication endpoints."""
 
+import asyncio
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import bcrypt
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import security
+from app.core.security import create_access_token, decode_token
 from app.models.user import User
 
 
@@ -51,6 +60,19 @@ async def test_login_success(client: AsyncClient, test_user: User) -> None:
     assert "access_token" in response.json()
 
 
+@pytest.mark.asyncio
+async def test_login_email_case_insensitive(
+    client: AsyncClient, test_user: User
+) -> None:
+    """Test login matches the email regardless of case."""
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": test_user.email.upper(), "password": "testpassword123"},
+    )
+
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_login_wrong_password(client: AsyncClient, test_user: User) -> None:
     """Test login with wrong password fails."""
@@ -62,9 +84,81 @@ async def test_login_wrong_password(client: AsyncClient, test_user: User) -> Non
     assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_login_unknown_email(client: AsyncClient) -> None:
+    """Test login with an unregistered email fails like a wrong password."""
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "nobody@example.com", "password": "testpassword123"},
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Incorrect email or password"
+
+
 @pytest.mark.asyncio
 async def test_protected_endpoint_without_token(client: AsyncClient) -> None:
     """Test accessing protected endpoint without token fails."""
     response = await client.get("/api/v1/robots")
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_legacy_bcrypt(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Test legacy bcrypt hashes still verify and are upgraded to Argon2id."""
+    user = User(
+        id=uuid4(),
+        email="legacy@example.com",
+        hashed_password=bcrypt.hashpw(b"legacypassword123", bcrypt.gensalt()).decode(),
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": user.email, "password": "legacypassword123"},
+    )
+
+    assert response.status_code == 200
+    assert user.hashed_password.startswith("$argon2id$")
+
+
+@pytest.mark.asyncio
+async def test_protected_endpoint_with_invalid_token(client: AsyncClient) -> None:
+    """Test accessing protected endpoint with a tampered token fails."""
+    token = create_access_token(subject=str(uuid4()))
+    response = await client.get(
+        "/api/v1/robots", headers={"Authorization": f"Bearer {token}x"}
+    )
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_cached_token_rejected_after_expiry() -> None:
+    """Test a cached token stops validating once its exp claim has passed."""
+    token = create_access_token(str(uuid4()), expires_delta=timedelta(seconds=1))
+    payload = decode_token(token)
+    assert payload is not None
+
+    # Cached entries never outlive the token's own expiry
+    await asyncio.sleep(max(payload["exp"] - time.time(), 0) + 0.05)
+
+    assert decode_token(token) is None
+
+
+def test_token_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the decoded-token cache evicts its oldest entries at the size cap."""
+    cache: dict = {}
+    monkeypatch.setattr(security, "_TOKEN_CACHE", cache)
+    monkeypatch.setattr(security, "_TOKEN_CACHE_MAX_SIZE", 3)
+
+    subjects = [str(uuid4()) for _ in range(5)]
+    for subject in subjects:
+        assert decode_token(create_access_token(subject)) is not None
+
+    assert len(cache) == 3
+    assert [payload["sub"] for _, payload in cache.values()] == subjects[2:]
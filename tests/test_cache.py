@@ -0,0 +1,100 @@
+"""Tests for the response cache."""
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import ResponseCache, get_response_cache
+from app.main import app
+from tests.conftest import bulk_insert_robots
+
+
+@pytest_asyncio.fixture
+async def cache() -> ResponseCache:
+    """Create a response cache backed by an in-memory Redis."""
+    return ResponseCache(FakeAsyncRedis())
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_then_hit(cache: ResponseCache) -> None:
+    """Test a stored payload is returned until it is invalidated."""
+    key = cache.key("robots", cursor=None, limit=10)
+    assert await cache.get(key) is None
+
+    await cache.set("robots", key, b"[]")
+    assert await cache.get(key) == b"[]"
+    assert key != cache.key("robots", cursor=None, limit=20)
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidate_namespace(cache: ResponseCache) -> None:
+    """Test invalidation drops one namespace and leaves the others."""
+    robots_key = cache.key("robots", limit=10)
+    missions_key = cache.key("missions", limit=10)
+    await cache.set("robots", robots_key, b"robots")
+    await cache.set("missions", missions_key, b"missions")
+
+    await cache.invalidate("robots")
+
+    assert await cache.get(robots_key) is None
+    assert await cache.get(missions_key) == b"missions"
+
+
+@pytest.mark.asyncio
+async def test_list_robots_cached_until_write(
+    client: AsyncClient,
+    auth_headers: dict,
+    cache: ResponseCache,
+    db_session: AsyncSession,
+) -> None:
+    """Test the robot list is served from cache until an API write."""
+    app.dependency_overrides[get_response_cache] = lambda: cache
+
+    response = await client.get("/api/v1/robots", headers=auth_headers)
+    assert response.json()["items"] == []
+
+    # Written behind the API's back, so the cached page is still served
+    await bulk_insert_robots(
+        db_session, [{"name": "Hidden", "serial_number": "CACHE-001"}]
+    )
+    response = await client.get("/api/v1/robots", headers=auth_headers)
+    assert response.json()["items"] == []
+
+    response = await client.post(
+        "/api/v1/robots",
+        headers=auth_headers,
+        json={"name": "Visible", "serial_number": "CACHE-002"},
+    )
+    assert response.status_code == 201
+
+    response = await client.get("/api/v1/robots", headers=auth_headers)
+    assert {r["name"] for r in response.json()["items"]} == {"Hidden", "Visible"}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_runs_after_commit(
+    client: AsyncClient,
+    auth_headers: dict,
+    cache: ResponseCache,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test writes commit before invalidating, so reads cannot re-cache old rows."""
+    in_transaction: list[bool] = []
+
+    async def invalidate(*namespaces: str) -> None:
+        in_transaction.append(db_session.in_transaction())
+
+    monkeypatch.setattr(cache, "invalidate", invalidate)
+    app.dependency_overrides[get_response_cache] = lambda: cache
+
+    response = await client.post(
+        "/api/v1/robots",
+        headers=auth_headers,
+        json={"name": "Committed", "serial_number": "CACHE-003"},
+    )
+
+    assert response.status_code == 201
+    assert in_transaction == [False]
@@ -16,7 +16,7 @@ async def test_list_missions_empty(client: AsyncClient, auth_headers: dict) -> N
     response = await client.get("/api/v1/missions", headers=auth_headers)
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"items": [], "next_cursor": None}
 
 
 @pytest.mark.asyncio
@@ -98,3 +98,126 @@ async def test_delete_mission(client: AsyncClient, auth_headers: dict, db_sessio
     response = await client.delete(f"/api/v1/missions/{mission.id}", headers=auth_headers)
 
     assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_update_mission_status_sets_timestamps(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+) -> None:
+    """Test status transitions stamp started_at once and completed_at."""
+    mission = Mission(
+        id=uuid4(),
+        name="Lifecycle Test",
+        status=MissionStatus.ASSIGNED,
+        priority=MissionPriority.NORMAL,
+    )
+    db_session.add(mission)
+    await db_session.commit()
+
+    response = await client.patch(
+        f"/api/v1/missions/{mission.id}",
+        headers=auth_headers,
+        json={"status": "in_progress"},
+    )
+    assert response.status_code == 200
+    started_at = response.json()["started_at"]
+    assert started_at is not None
+
+    response = await client.patch(
+        f"/api/v1/missions/{mission.id}",
+        headers=auth_headers,
+        json={"status": "in_progress", "progress": 50},
+    )
+    assert response.status_code == 200
+    assert response.json()["started_at"] == started_at
+
+    response = await client.patch(
+        f"/api/v1/missions/{mission.id}",
+        headers=auth_headers,
+        json={"status": "completed"},
+    )
+    assert response.status_code == 200
+    assert response.json()["completed_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_mission_not_found(client: AsyncClient, auth_headers: dict) -> None:
+    """Test deleting a non-existent mission fails."""
+    response = await client.delete(f"/api/v1/missions/{uuid4()}", headers=auth_headers)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_assign_mission_robot_not_found(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+) -> None:
+    """Test assigning a non-existent robot fails."""
+    mission = Mission(
+        id=uuid4(),
+        name="No Robot",
+        status=MissionStatus.PENDING,
+        priority=MissionPriority.NORMAL,
+    )
+    db_session.add(mission)
+    await db_session.commit()
+
+    response = await client.post(
+        f"/api/v1/missions/{mission.id}/assign",
+        headers=auth_headers,
+        json={"robot_id": str(uuid4())},
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Robot not found"
+
+
+@pytest.mark.asyncio
+async def test_assign_completed_mission_fails(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession, test_robot: Robot
+) -> None:
+    """Test a finished mission cannot be reassigned."""
+    mission = Mission(
+        id=uuid4(),
+        name="Done",
+        status=MissionStatus.COMPLETED,
+        priority=MissionPriority.NORMAL,
+    )
+    db_session.add(mission)
+    await db_session.commit()
+
+    response = await client.post(
+        f"/api/v1/missions/{mission.id}/assign",
+        headers=auth_headers,
+        json={"robot_id": str(test_robot.id)},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_update_mission_empty_body(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+) -> None:
+    """Test an empty PATCH returns the mission unchanged."""
+    mission = Mission(
+        id=uuid4(),
+        name="Unchanged",
+        status=MissionStatus.PENDING,
+        priority=MissionPriority.NORMAL,
+    )
+    db_session.add(mission)
+    await db_session.commit()
+
+    response = await client.patch(
+        f"/api/v1/missions/{mission.id}", headers=auth_headers, json={}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Unchanged"
+    assert response.json()["status"] == "pending"
+
+    response = await client.patch(
+        f"/api/v1/missions/{uuid4()}", headers=auth_headers, json={}
+    )
+    assert response.status_code == 404
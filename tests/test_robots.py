@@ -1,11 +1,24 @@
 """Tests for robot endpoints."""
 
+import asyncio
 from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
 
-from app.models.robot import Robot
+from app.api.v1 import robots as robots_api
+from app.core.cache import ResponseCache, get_response_cache
+from app.core.security import create_access_token
+from app.core.status_batcher import StatusBatcher
+from app.db.session import get_session
+from app.main import app
+from app.models.robot import Robot, RobotStatus
+from app.models.user import User, UserRole
+from tests.conftest import TEST_DATABASE_URL, bulk_insert_robots, cached_password_hash
 
 
 @pytest.mark.asyncio
@@ -14,7 +27,7 @@ async def test_list_robots_empty(client: AsyncClient, auth_headers: dict) -> Non
     response = await client.get("/api/v1/robots", headers=auth_headers)
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"items": [], "next_cursor": None}
 
 
 @pytest.mark.asyncio
@@ -24,8 +37,56 @@ async def test_list_robots(client: AsyncClient, auth_headers: dict, test_robot:
 
     assert response.status_code == 200
     data = response.json()
-    assert len(data) == 1
-    assert data[0]["name"] == test_robot.name
+    assert len(data["items"]) == 1
+    assert data["items"][0]["name"] == test_robot.name
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_robots_paginates(client: AsyncClient, auth_headers: dict) -> None:
+    """Test walking the robot list with cursors."""
+    for i in range(3):
+        await client.post(
+            "/api/v1/robots",
+            headers=auth_headers,
+            json={"name": f"Robot {i}", "serial_number": f"PAGE-{i}"},
+        )
+
+    response = await client.get("/api/v1/robots?limit=2", headers=auth_headers)
+    first = response.json()
+    assert [r["name"] for r in first["items"]] == ["Robot 2", "Robot 1"]
+    assert first["next_cursor"] is not None
+
+    response = await client.get(
+        "/api/v1/robots",
+        headers=auth_headers,
+        params={"limit": 2, "cursor": first["next_cursor"]},
+    )
+    second = response.json()
+    assert [r["name"] for r in second["items"]] == ["Robot 0"]
+    assert second["next_cursor"] is None
+
+    response = await client.get("/api/v1/robots?cursor=bogus", headers=auth_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_robots_walks_fleet(
+    client: AsyncClient, auth_headers: dict, robot_fleet: list[Robot]
+) -> None:
+    """Test cursors visit every robot exactly once, even with tied timestamps."""
+    seen: list[str] = []
+    params: dict = {"limit": 20}
+    while True:
+        response = await client.get("/api/v1/robots", headers=auth_headers, params=params)
+        page = response.json()
+        seen.extend(r["id"] for r in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert len(seen) == len(robot_fleet)
+    assert set(seen) == {str(robot.id) for robot in robot_fleet}
 
 
 @pytest.mark.asyncio
@@ -47,6 +108,21 @@ async def test_create_robot(client: AsyncClient, auth_headers: dict) -> None:
     assert data["status"] == "offline"
 
 
+@pytest.mark.asyncio
+async def test_create_robot_duplicate_serial(
+    client: AsyncClient, auth_headers: dict, test_robot: Robot
+) -> None:
+    """Test that serial numbers must be unique."""
+    response = await client.post(
+        "/api/v1/robots",
+        headers=auth_headers,
+        json={"name": "Clone", "serial_number": test_robot.serial_number},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Serial number already registered"
+
+
 @pytest.mark.asyncio
 async def test_get_robot(client: AsyncClient, auth_headers: dict, test_robot: Robot) -> None:
     """Test getting a specific robot."""
@@ -64,6 +140,23 @@ async def test_get_robot_not_found(client: AsyncClient, auth_headers: dict) -> N
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_update_robot_bumps_updated_at(
+    client: AsyncClient, auth_headers: dict, test_robot: Robot
+) -> None:
+    """Test the database stamps updated_at when a robot changes."""
+    response = await client.patch(
+        f"/api/v1/robots/{test_robot.id}",
+        headers=auth_headers,
+        json={"name": "Renamed Robot"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Renamed Robot"
+    assert data["updated_at"] > data["created_at"]
+
+
 @pytest.mark.asyncio
 async def test_update_robot_status(client: AsyncClient, auth_headers: dict, test_robot: Robot) -> None:
     """Test updating robot status."""
@@ -79,9 +172,206 @@ async def test_update_robot_status(client: AsyncClient, auth_headers: dict, test
     assert data["battery_level"] == 75.5
 
 
+@pytest.mark.asyncio
+async def test_update_robot_empty_body(
+    client: AsyncClient, auth_headers: dict, test_robot: Robot
+) -> None:
+    """Test empty PATCH bodies return the robot unchanged."""
+    path = f"/api/v1/robots/{test_robot.id}"
+    for path in (path, f"{path}/status"):
+        response = await client.patch(path, headers=auth_headers, json={})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Test Robot"
+        assert response.json()["status"] == "idle"
+
+    missing = f"/api/v1/robots/{uuid4()}"
+    for path in (missing, f"{missing}/status"):
+        response = await client.patch(path, headers=auth_headers, json={})
+        assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_delete_robot(client: AsyncClient, auth_headers: dict, test_robot: Robot) -> None:
     """Test deleting a robot."""
     response = await client.delete(f"/api/v1/robots/{test_robot.id}", headers=auth_headers)
 
     assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_status_batcher_coalesces_updates(
+    db_session: AsyncSession, test_robot: Robot
+) -> None:
+    """Test concurrent status updates for one robot flush as one merged row."""
+    # Share the test's connection so the batcher sees its uncommitted robot
+    batcher = StatusBatcher(
+        session_maker=async_sessionmaker(
+            db_session.bind,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+    )
+    batcher.start()
+    try:
+        first, second, missing = await asyncio.gather(
+            batcher.submit(test_robot.id, {"status": RobotStatus.ACTIVE}),
+            batcher.submit(test_robot.id, {"battery_level": 42.0}),
+            batcher.submit(uuid4(), {"status": RobotStatus.IDLE}),
+        )
+    finally:
+        await batcher.stop()
+
+    assert missing is None
+    for robot in (first, second):
+        assert robot.status == RobotStatus.ACTIVE
+        assert robot.battery_level == 42.0
+
+
+@pytest.mark.asyncio
+async def test_status_batcher_isolates_failed_robot(
+    db_session: AsyncSession, robot_fleet: list[Robot]
+) -> None:
+    """Test a bad row fails only its own requests, and empty updates read back."""
+    bad, good, untouched = robot_fleet[:3]
+    batcher = StatusBatcher(
+        session_maker=async_sessionmaker(
+            db_session.bind,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+    )
+    batcher.start()
+    try:
+        failed, updated, unchanged = await asyncio.gather(
+            batcher.submit(bad.id, {"status": None}),
+            batcher.submit(good.id, {"battery_level": 55.0}),
+            batcher.submit(untouched.id, {}),
+            return_exceptions=True,
+        )
+    finally:
+        await batcher.stop()
+
+    assert isinstance(failed, IntegrityError)
+    assert updated.battery_level == 55.0
+    assert unchanged.id == untouched.id
+    assert unchanged.status == RobotStatus.IDLE
+
+
+@pytest.mark.asyncio
+async def test_status_updates_beyond_pool_size(
+    http_client: AsyncClient, db_engine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test more concurrent status PATCHes than pooled connections all succeed.
+
+    Requests must not hold their connection while waiting on the batcher,
+    which needs one from the same pool to write.
+    """
+    engine = create_async_engine(
+        TEST_DATABASE_URL, pool_size=2, max_overflow=0, pool_timeout=2
+    )
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    # Committed for real: requests and the batcher each use their own connection
+    async with session_maker() as session:
+        user = User(
+            email=f"pool-{uuid4().hex[:8]}@example.com",
+            hashed_password=await cached_password_hash("testpassword123"),
+            full_name="Pool User",
+            role=UserRole.OPERATOR,
+        )
+        session.add(user)
+        [robot] = await bulk_insert_robots(
+            session, [{"name": "Pooled", "serial_number": f"POOL-{uuid4().hex[:8]}"}]
+        )
+        await session.commit()
+
+    async def override_get_session():
+        async with session_maker() as session:
+            yield session
+            await session.commit()
+
+    batcher = StatusBatcher(session_maker=session_maker)
+    monkeypatch.setattr(robots_api, "status_batcher", batcher)
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_response_cache] = lambda: ResponseCache(redis=None)
+    headers = {"Authorization": f"Bearer {create_access_token(str(user.id))}"}
+    batcher.start()
+    try:
+        responses = await asyncio.gather(
+            *(
+                http_client.patch(
+                    f"/api/v1/robots/{robot.id}/status",
+                    headers=headers,
+                    json={"battery_level": float(n)},
+                )
+                for n in range(8)
+            )
+        )
+    finally:
+        await batcher.stop()
+        app.dependency_overrides.clear()
+        async with session_maker() as session:
+            await session.execute(delete(Robot).where(Robot.id == robot.id))
+            await session.execute(delete(User).where(User.id == user.id))
+            await session.commit()
+        await engine.dispose()
+
+    assert [response.status_code for response in responses] == [200] * 8
+
+
+@pytest.mark.asyncio
+async def test_status_batcher_stop_fails_pending_updates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test stopping mid-write fails waiting handlers and refuses new updates."""
+    batcher = StatusBatcher()
+
+    async def hang(updates: dict) -> dict:
+        await asyncio.Event().wait()
+        return {}
+
+    monkeypatch.setattr(batcher, "_write", hang)
+    batcher.start()
+    in_flight = asyncio.create_task(batcher.submit(uuid4(), {"battery_level": 1.0}))
+    await asyncio.sleep(batcher.max_wait * 2)
+
+    await batcher.stop()
+
+    with pytest.raises(RuntimeError, match="stopped"):
+        await asyncio.wait_for(in_flight, 1)
+    with pytest.raises(RuntimeError, match="not running"):
+        await batcher.submit(uuid4(), {})
+
+
+@pytest.mark.asyncio
+async def test_robot_missions_require_explicit_load(
+    db_session: AsyncSession, test_robot: Robot
+) -> None:
+    """Test Robot.missions is never lazy-loaded behind the caller's back."""
+    result = await db_session.execute(
+        select(Robot)
+        .where(Robot.id == test_robot.id)
+        .execution_options(populate_existing=True)
+    )
+    robot = result.scalar_one()
+    with pytest.raises(InvalidRequestError):
+        robot.missions
+
+    result = await db_session.execute(
+        select(Robot)
+        .where(Robot.id == test_robot.id)
+        .options(selectinload(Robot.missions))
+        .execution_options(populate_existing=True)
+    )
+    assert result.scalar_one().missions == []
+
+
+@pytest.mark.asyncio
+async def test_robot_repr_skips_unloaded_attributes(
+    db_session: AsyncSession, test_robot: Robot
+) -> None:
+    """Test repr of an expired robot does not try to reload it."""
+    assert repr(test_robot) == f"<Robot Test Robot ({test_robot.serial_number})>"
+
+    db_session.expire(test_robot)
+    assert repr(test_robot) == "<Robot ? (?)>"
@@ -0,0 +1,155 @@
+"""Tests for WebSocket fan-out: the connection manager and broadcaster."""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import orjson
+import pytest
+
+from app.core import broadcaster as broadcaster_module
+from app.core.broadcaster import Broadcaster
+from app.core.websocket import OUTBOX_SIZE, ConnectionManager
+from app.models.robot import Robot
+from app.schemas.ws import encode_connected, encode_status_update
+
+
+class FakeWebSocket:
+    """Records sent frames; optionally fails every send."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.frames: list[str] = []
+        self.fail = fail
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.frames.append(data)
+
+
+async def _let_tasks_run() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_queued_messages_share_one_frame() -> None:
+    """Test messages queued before the sender runs go out newline-delimited."""
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    robot_id = uuid4()
+    await manager.connect(websocket, robot_id)
+
+    for n in range(3):
+        await manager.broadcast_robot_update(robot_id, {"n": n})
+    await _let_tasks_run()
+
+    assert websocket.frames == ['{"n":0}\n{"n":1}\n{"n":2}']
+    manager.disconnect(websocket)
+
+
+@pytest.mark.asyncio
+async def test_full_outbox_drops_oldest() -> None:
+    """Test a lagging client keeps only the newest OUTBOX_SIZE messages."""
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    robot_id = uuid4()
+    await manager.connect(websocket, robot_id)
+
+    for n in range(OUTBOX_SIZE + 5):
+        await manager.broadcast_robot_update(robot_id, {"n": n})
+    await _let_tasks_run()
+
+    [frame] = websocket.frames
+    received = [orjson.loads(line)["n"] for line in frame.split("\n")]
+    assert received == list(range(5, OUTBOX_SIZE + 5))
+    manager.disconnect(websocket)
+
+
+@pytest.mark.asyncio
+async def test_failed_send_disconnects_client() -> None:
+    """Test a send error drops the client's subscriptions, outbox and sender."""
+    manager = ConnectionManager()
+    dead, alive = FakeWebSocket(fail=True), FakeWebSocket()
+    robot_id = uuid4()
+    await manager.connect(dead, robot_id)
+    await manager.connect(alive, robot_id)
+
+    await manager.broadcast_robot_update(robot_id, {"n": 0})
+    sender = manager._senders[dead]
+    await _let_tasks_run()
+
+    assert sender.done()
+    assert dead not in manager._outboxes
+    assert dead not in manager._senders
+    assert manager.get_connection_count(robot_id) == 1
+    assert alive.frames == ['{"n":0}']
+    manager.disconnect(alive)
+
+
+class RecordingManager:
+    """Stands in for the connection manager and records broadcasts."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[UUID, bytes]] = []
+
+    async def broadcast_robot_update(self, robot_id: UUID, data: bytes) -> None:
+        self.sent.append((robot_id, data))
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_drops_when_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a full queue counts drops and still delivers what was queued."""
+    recording = RecordingManager()
+    monkeypatch.setattr(broadcaster_module, "manager", recording)
+    broadcaster = Broadcaster(max_queue_size=2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    broadcaster.start()
+    try:
+        broadcaster.publish(first, b"1")
+        broadcaster.publish(second, b"2")
+        broadcaster.publish(third, b"3")
+        assert broadcaster.dropped == 1
+
+        await _let_tasks_run()
+    finally:
+        await broadcaster.stop()
+
+    assert recording.sent == [(first, b"1"), (second, b"2")]
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_sends_newest_payload_per_robot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a burst for one robot is broadcast once, with its latest payload."""
+    recording = RecordingManager()
+    monkeypatch.setattr(broadcaster_module, "manager", recording)
+    broadcaster = Broadcaster()
+    robot_id = uuid4()
+
+    broadcaster.start()
+    try:
+        for payload in (b"old", b"older", b"newest"):
+            broadcaster.publish(robot_id, payload)
+        await _let_tasks_run()
+    finally:
+        await broadcaster.stop()
+
+    assert recording.sent == [(robot_id, b"newest")]
+
+
+@pytest.mark.asyncio
+async def test_connected_message_matches_status_updates(test_robot: Robot) -> None:
+    """Test the initial robot frame has the same robot shape as later updates."""
+    connected = orjson.loads(encode_connected(test_robot, subscribers=1))
+    update = orjson.loads(encode_status_update(test_robot))
+
+    assert connected["event"] == "connected"
+    assert connected["robot_id"] == str(test_robot.id)
+    assert connected["subscribers"] == 1
+    assert connected["robot"] == update["robot"]
+    assert connected["robot"]["status"] == "idle"